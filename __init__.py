@@ -1,18 +1,28 @@
 import bpy
-import auto_editor
 import tempfile
 import hashlib
 import base64
-import requests
 import os
 import shutil
 import subprocess
+import queue
+import threading
+import time
+import json
+import logging
+import importlib.metadata
+import importlib.util
+import string
+import re
+import mmap
+import concurrent.futures
+import collections
 
 
 import sys
+import numpy as np
 import pysubs2
 
-from auto_editor.formats import json as ae_json
 from bpy.props import (
     BoolProperty,
     EnumProperty,
@@ -22,9 +32,119 @@ from bpy.props import (
 )
 from bpy.types import AddonPreferences, Operator
 
-import check_swear
+SWEAR_STOP_WORDS = ["ахуенно", "поебень", "поебалу", "выпиздили"]
 
-sch = check_swear.SwearingCheck(stop_words=["ахуенно", "поебень", "поебалу", "выпиздили" ])
+# check_swear pulls in scikit-learn and NLTK, so it isn't imported while
+# the add-on loads. register() builds the checker on a background thread
+# when the classifier preference is on, and the lock keeps that from
+# racing a first real classification
+swear_check = None
+swear_check_lock = threading.Lock()
+
+
+def get_swear_check():
+    global swear_check
+    with swear_check_lock:
+        if swear_check is None:
+            import check_swear
+
+            swear_check = check_swear.SwearingCheck(stop_words=SWEAR_STOP_WORDS)
+    return swear_check
+
+
+# Words known to be profane are matched by a set lookup before falling
+# back to the classifier
+PUNCTUATION = string.punctuation + "«»„“”…—–"
+KNOWN_SWEARS = frozenset(SWEAR_STOP_WORDS)
+# Known swears inside longer words (inflections, compounds), in one
+# compiled alternation, longest first
+KNOWN_SWEAR_RE = re.compile(
+    "|".join(map(re.escape, sorted(KNOWN_SWEARS, key=len, reverse=True)))
+)
+
+
+def normalize_word(word):
+    return word.strip().lower().strip(PUNCTUATION)
+
+
+# Classifier verdicts by normalized word, kept across sessions in
+# swear_cache.json so each word only ever goes through the classifier once
+swear_cache = {}
+
+
+# Numbers and leftover symbols can't be swears, so they never reach the
+# classifier
+NONWORD_RE = re.compile(r"[\W\d_]*")
+
+
+def is_swear(word, use_classifier=True):
+    word = normalize_word(word)
+    if NONWORD_RE.fullmatch(word):
+        return False
+    if word in KNOWN_SWEARS or KNOWN_SWEAR_RE.search(word):
+        return True
+    if not use_classifier:
+        return False
+    if word not in swear_cache:
+        swear_cache[word] = bool(get_swear_check().predict(word)[0])
+    return swear_cache[word]
+
+
+def classify_words(words):
+    """Runs every word not seen before through the classifier in one batch.
+
+    Each predict call reloads the vectorizer and model, so a single call
+    over the unique words is far cheaper than one call per word.
+    """
+    new_words = {normalize_word(w) for w in words} - KNOWN_SWEARS - swear_cache.keys()
+    new_words = {
+        w
+        for w in new_words
+        if not NONWORD_RE.fullmatch(w) and not KNOWN_SWEAR_RE.search(w)
+    }
+    if new_words:
+        new_words = list(new_words)
+        predictions = get_swear_check().predict(new_words)
+        swear_cache.update(zip(new_words, map(bool, predictions)))
+
+
+def warmup_swear_check():
+    """Runs one throwaway prediction so the first real one is fast.
+
+    The first predict downloads NLTK's stop words if they're missing and
+    compiles the stop word patterns, which is most of its latency.
+    """
+    try:
+        get_swear_check().predict(["warmup"])
+    except Exception as e:
+        print(f"Profanity check warmup failed: {e}")
+
+
+def swear_cache_path():
+    return os.path.join(get_cache_dir(), "swear_cache.json")
+
+
+def load_swear_cache():
+    try:
+        with open(swear_cache_path(), encoding="utf-8") as f:
+            swear_cache.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+
+def save_swear_cache():
+    with open(swear_cache_path(), "w", encoding="utf-8") as f:
+        json.dump(swear_cache, f, ensure_ascii=False)
+
+
+WORD_RE = re.compile(r"\w+")
+
+
+def censor_text(text, use_classifier=True):
+    """Replaces every swear word in text with ###, keeping the punctuation."""
+    return WORD_RE.sub(
+        lambda m: "###" if is_swear(m.group(), use_classifier) else m.group(), text
+    )
 
 bl_info = {
     "name": "vse utils",
@@ -38,8 +158,112 @@ bl_info = {
     "category": "Sequencer",
 }
 
-# Centralize cache handling
-AUTO_EDITOR_CACHE_DIR = f"{os.environ['XDG_CONFIG_HOME']}/auto-editor-cache"
+# The Auto-Editor operator is only registered when it's installed;
+# find_spec checks without paying for the import
+HAS_AUTO_EDITOR = importlib.util.find_spec("auto_editor") is not None
+
+
+def scenedetect_version():
+    """Returns the installed PySceneDetect version as a tuple, or None."""
+    try:
+        version = importlib.metadata.version("scenedetect")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+    return tuple(int(part) for part in re.findall(r"\d+", version)[:3])
+
+
+# HistogramDetector was added in PySceneDetect 0.6.4; read the version from
+# the package metadata so the add-on doesn't import scenedetect on load
+HAS_HISTOGRAM_DETECTOR = (scenedetect_version() or ()) >= (0, 6, 4)
+
+# Centralize cache handling. XDG_CONFIG_HOME is usually unset outside
+# Linux, so fall back to ~/.config. Created once in register().
+def get_cache_dir():
+    base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+        os.path.expanduser("~"), ".config"
+    )
+    return os.path.join(base, "auto-editor-cache")
+
+
+# Mixdowns are large and can always be rebuilt, so they go in the user's
+# cache dir rather than next to the small JSON caches, and get pruned
+MIXDOWN_MAX_AGE = 7 * 24 * 60 * 60
+MIXDOWN_MAX_BYTES = 2 * 1024**3
+
+
+def get_mixdown_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "auto-editor-cache", "mixdowns")
+
+
+def prune_mixdowns():
+    """Deletes old mixdowns from the mixdown cache.
+
+    Drops those unused for MIXDOWN_MAX_AGE, then the least recently used
+    until the rest fit in MIXDOWN_MAX_BYTES.
+    """
+    try:
+        entries = [e for e in os.scandir(get_mixdown_dir()) if e.is_file()]
+    except FileNotFoundError:
+        return
+    # Cache hits touch the file, so mtime is the last use
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    cutoff = time.time() - MIXDOWN_MAX_AGE
+    total = 0
+    for entry in entries:
+        st = entry.stat()
+        total += st.st_size
+        if st.st_mtime < cutoff or total > MIXDOWN_MAX_BYTES:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def new_cache_hash():
+    """Hash object for cache keys: xxh3 when xxhash is installed, else blake2b.
+
+    Neither needs to be cryptographic; both are much faster than md5.
+    """
+    try:
+        import xxhash
+
+        return xxhash.xxh3_64()
+    except ImportError:
+        return hashlib.blake2b(digest_size=16)
+
+
+def write_json_atomic(path, data):
+    """Writes data as JSON to a temp file next to path, then renames it over.
+
+    A crash mid-write or two writers racing on one key never leave a
+    truncated file at path.
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=os.path.dirname(path), suffix=".part", delete=False
+    ) as f:
+        json.dump(data, f)
+    os.replace(f.name, path)
+
+
+def start_process(command):
+    """Starts command with its stderr drained by a daemon thread.
+
+    Returns the Popen and a deque holding the last lines of stderr, so
+    failures can be reported without the pipe ever filling up.
+    """
+    proc = subprocess.Popen(command, stderr=subprocess.PIPE, text=True, errors="replace")
+    stderr_tail = collections.deque(maxlen=20)
+    drain = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+    drain.start()
+    return proc, stderr_tail
+
+
+def last_error_line(stderr_tail):
+    lines = [line.strip() for line in stderr_tail if line.strip()]
+    return lines[-1] if lines else ""
 
 
 # Preferences
@@ -56,24 +280,505 @@ class MyAddonPreferences(AddonPreferences):
         default="SOFT",
     )
 
+    detector: EnumProperty(
+        name="Shot Detector",
+        description="Choose the detector used for shot detection",
+        items=(
+            ("HIST", "Histogram", "Compare luma histograms (fast, OpenCV)"),
+            ("CONTENT", "Content", "Compare HSV content between frames"),
+            (
+                "ADAPTIVE",
+                "Adaptive",
+                "Compare content against a rolling average, fewer false cuts on motion",
+            ),
+            ("LUMA", "Luma (PyAV)", "Decode straight to grayscale and compare luma"),
+            (
+                "HIST_L1",
+                "Luma Histogram L1 (PyAV)",
+                "L1 distance between luma histograms, Numba compiled",
+            ),
+            (
+                "PIXEL",
+                "Changed Pixels (PyAV)",
+                "Fraction of changed luma pixels, Numba compiled",
+            ),
+        ),
+        default="HIST" if HAS_HISTOGRAM_DETECTOR else "CONTENT",
+    )
+
+    downscale: IntProperty(
+        name="Detection Downscale",
+        description="Integer factor to shrink frames by before shot detection (0 = automatic)",
+        default=0,
+        min=0,
+    )
+
+    frame_skip: IntProperty(
+        name="Frame Skip",
+        description="Frames to skip between analyzed frames for the PySceneDetect "
+        "detectors; faster, but cuts land less precisely (0 = analyze every frame)",
+        default=0,
+        min=0,
+        max=4,
+    )
+
+    backend: EnumProperty(
+        name="Video Backend",
+        description="Choose the decoder PySceneDetect reads the movie with",
+        items=(
+            ("OPENCV", "OpenCV", "OpenCV VideoCapture (FFmpeg decodes with threads)"),
+            ("PYAV", "PyAV", "PyAV with FFmpeg frame and slice threading"),
+        ),
+        default="OPENCV",
+    )
+
+    hardware_decode: BoolProperty(
+        name="Hardware Decoding",
+        description="Decode on the GPU (CUDA, VAAPI, D3D11VA or VideoToolbox) "
+        "for the Luma detector when PyAV supports it",
+        default=False,
+    )
+
+    swear_classifier: BoolProperty(
+        name="Profanity Classifier",
+        description="Check words that aren't on the known swear list with the "
+        "check_swear model; off matches the list only",
+        default=True,
+    )
+
+    multipart_upload: BoolProperty(
+        name="Multipart Upload",
+        description="Send audio to the transcription server as multipart form "
+        "data instead of a base64 JSON body; the server has to accept it",
+        default=False,
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "split_type")
+        layout.prop(self, "detector")
+        layout.prop(self, "downscale")
+        layout.prop(self, "frame_skip")
+        layout.prop(self, "backend")
+        layout.prop(self, "hardware_decode")
+        layout.prop(self, "swear_classifier")
+        layout.prop(self, "multipart_upload")
+
+
+# Default detection threshold per detector. HIST cuts once the luma
+# histogram correlation between frames drops below ~0.7, ADAPTIVE once a
+# frame's content change is 3x the average of its neighbours, LUMA once the
+# mean absolute luma difference reaches 30 (of 255), HIST_L1 at half the
+# maximum histogram distance and PIXEL once 60% of pixels change by over
+# PIXEL_DELTA.
+DETECTOR_THRESHOLDS = {
+    "HIST": 0.3,
+    "CONTENT": 27,
+    "ADAPTIVE": 3.0,
+    "LUMA": 30,
+    "HIST_L1": 1.0,
+    "PIXEL": 0.6,
+}
+PIXEL_DELTA = 30
+
+# Detectors that decode with PyAV instead of going through PySceneDetect
+PYAV_DETECTORS = {"LUMA", "HIST_L1", "PIXEL"}
+
+
+# Scene detection (import when needed). Doesn't touch bpy so it can run
+# off the main thread; callback(image, frame_num) fires on every cut.
+# Returns the cut frame numbers.
+def find_scenes(
+    video_path,
+    fps,
+    threshold,
+    start,
+    end,
+    detector="HIST",
+    downscale=0,
+    backend="OPENCV",
+    hwaccel=False,
+    frame_skip=0,
+    callback=None,
+    stop=None,
+):
+    if detector in PYAV_DETECTORS:
+        return find_cuts_pyav(
+            video_path,
+            fps,
+            threshold,
+            start,
+            end,
+            detector,
+            downscale,
+            hwaccel,
+            callback,
+            stop=stop,
+        )
 
+    # Long ranges are split into chunks of at least a minute, up to one per
+    # core, and detected side by side. Decoding releases the GIL, so threads
+    # scale without pickling anything across to a process pool.
+    chunks = max(1, min(os.cpu_count() or 1, int((end - start) // (fps * 60))))
+    if chunks == 1:
+        return find_scenes_chunk(
+            video_path,
+            fps,
+            threshold,
+            start,
+            end,
+            detector,
+            downscale,
+            backend,
+            frame_skip,
+            callback,
+            stop=stop,
+        )
 
-# Scene detection (import when needed)
-def find_scenes(video_path, threshold, start, end):
-    from scenedetect import ContentDetector, SceneManager, open_video
-
-    render = bpy.context.scene.render
-    fps = round((render.fps / render.fps_base), 3)
-    video = open_video(video_path, framerate=fps)
+    bounds = [start + (end - start) * i // chunks for i in range(chunks + 1)]
+    with concurrent.futures.ThreadPoolExecutor(chunks) as pool:
+        futures = [
+            pool.submit(
+                find_scenes_chunk,
+                video_path,
+                fps,
+                threshold,
+                chunk_start,
+                chunk_end,
+                detector,
+                downscale,
+                backend,
+                frame_skip,
+                callback,
+                # Later chunks start a second early so the detectors have
+                # seen some frames by the chunk boundary
+                lead_in=int(fps) if i else 0,
+                stop=stop,
+            )
+            for i, (chunk_start, chunk_end) in enumerate(zip(bounds, bounds[1:]))
+        ]
+        return sorted(cut for future in futures for cut in future.result())
+
+
+# One PySceneDetect pass over [start, end]. Decoding starts lead_in frames
+# earlier, and cuts inside that lead-in are dropped. Setting the stop event
+# ends the pass early.
+def find_scenes_chunk(
+    video_path,
+    fps,
+    threshold,
+    start,
+    end,
+    detector,
+    downscale,
+    backend,
+    frame_skip,
+    callback,
+    lead_in=0,
+    stop=None,
+):
+    from scenedetect import AdaptiveDetector, ContentDetector, SceneManager, open_video
+
+    report_from = start
+    start = max(0, start - lead_in)
+    if lead_in and callback:
+        user_callback = callback
+
+        def callback(image, frame_num):
+            if frame_num >= report_from:
+                user_callback(image, frame_num)
+
+    # Only warnings and errors; per-frame progress isn't shown anywhere
+    logging.getLogger("pyscenedetect").setLevel(logging.WARNING)
+
+    if backend == "PYAV":
+        # PyAV decodes on a single thread unless told otherwise
+        video = open_video(
+            video_path,
+            framerate=fps,
+            backend="pyav",
+            threading_mode="AUTO",
+            suppress_output=True,
+        )
+    else:
+        video = open_video(video_path, framerate=fps)
     scene_manager = SceneManager()
-    scene_manager.add_detector(ContentDetector(threshold=threshold))
+    # Both detectors normalize their scores per pixel, so thresholds hold
+    # across downscale factors
+    if downscale:
+        scene_manager.auto_downscale = False
+        scene_manager.downscale = downscale
+    else:
+        scene_manager.auto_downscale = True
+    if detector == "HIST":
+        try:
+            from scenedetect import HistogramDetector
+        except ImportError:
+            raise ImportError("PySceneDetect >= 0.6.4 required for HIST") from None
+        scene_manager.add_detector(HistogramDetector(threshold=threshold, bins=256))
+    elif detector == "ADAPTIVE":
+        scene_manager.add_detector(AdaptiveDetector(adaptive_threshold=threshold))
+    else:
+        scene_manager.add_detector(ContentDetector(threshold=threshold))
     video.seek((start / fps))
-    scene_manager.detect_scenes(video, end_time=(end / fps))
 
-    return scene_manager.get_scene_list()
+    finished = threading.Event()
+    if stop is not None:
+        # SceneManager.stop() is thread-safe; the watcher polls so it exits
+        # together with the pass
+        def watch():
+            while not finished.is_set():
+                if stop.wait(0.1):
+                    scene_manager.stop()
+                    return
+
+        threading.Thread(target=watch, daemon=True).start()
+    try:
+        scene_manager.detect_scenes(
+            video,
+            end_time=(end / fps),
+            frame_skip=frame_skip,
+            show_progress=False,
+            callback=callback,
+        )
+    finally:
+        finished.set()
+
+    cuts = [scene[0].get_frames() for scene in scene_manager.get_scene_list()[1:]]
+    return [c for c in cuts if c >= report_from]
+
+
+def get_hwaccel():
+    """Returns a PyAV HWAccel for the first available GPU decoder, or None.
+
+    Needs PyAV 14 or newer; decoding falls back to software otherwise.
+    """
+    try:
+        from av.codec.hwaccel import HWAccel, hwdevices_available
+    except ImportError:
+        return None
+
+    available = hwdevices_available()
+    for device_type in ("cuda", "vaapi", "d3d11va", "videotoolbox"):
+        if device_type in available:
+            return HWAccel(device_type=device_type, allow_software_fallback=True)
+    return None
+
+
+def find_cuts_pyav(
+    video_path,
+    fps,
+    threshold,
+    start,
+    end,
+    detector="LUMA",
+    downscale=0,
+    hwaccel=False,
+    callback=None,
+    min_scene_len=15,
+    stop=None,
+):
+    """Luma-only shot detection, decoding straight to grayscale with PyAV.
+
+    Frames are converted and downscaled by libswscale, so only the Y plane
+    reaches Python. A frame is a cut when its score against the previous
+    frame reaches threshold: mean absolute difference for LUMA, histogram
+    L1 distance for HIST_L1, changed pixel fraction for PIXEL. Returns the
+    cut frame numbers; decoding ends early once stop is set.
+    """
+    import av
+    import av.logging
+    import cv2
+
+    from . import detectors_numba
+
+    # FFmpeg's per-frame decoder warnings would otherwise go to stderr
+    av.logging.set_level(av.logging.ERROR)
+
+    if detector == "HIST_L1":
+
+        def feature(gray):
+            return np.bincount(gray.ravel(), minlength=256) / gray.size
+
+        score = detectors_numba.hist_l1
+    elif detector == "PIXEL":
+        feature = np.ravel
+
+        def score(prev, cur):
+            return detectors_numba.pairwise_diff_frac(prev, cur, PIXEL_DELTA)
+
+    else:
+
+        def feature(gray):
+            return gray
+
+        def score(prev, cur):
+            return cv2.mean(cv2.absdiff(cur, prev))[0]
+
+    open_kwargs = {}
+    if hwaccel:
+        accel = get_hwaccel()
+        if accel:
+            open_kwargs["hwaccel"] = accel
+
+    cuts = []
+    with av.open(video_path, **open_kwargs) as container:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+
+        # Same automatic factor as PySceneDetect: about 256 pixels wide
+        factor = downscale or max(1, stream.codec_context.width // 256)
+        width = stream.codec_context.width // factor
+        height = stream.codec_context.height // factor
+
+        container.seek(int(start / fps / stream.time_base), stream=stream)
+        prev = None
+        last_cut = start
+        for frame in container.decode(stream):
+            frame_num = round(frame.time * fps)
+            if frame_num < start:
+                continue
+            if frame_num >= end or (stop is not None and stop.is_set()):
+                break
+
+            gray = frame.reformat(format="gray", width=width, height=height)
+            gray = gray.to_ndarray()
+            cur = feature(gray)
+            if (
+                prev is not None
+                and frame_num - last_cut >= min_scene_len
+                and score(prev, cur) >= threshold
+            ):
+                cuts.append(frame_num)
+                last_cut = frame_num
+                if callback:
+                    callback(gray, frame_num)
+            prev = cur
+
+    return cuts
+
+
+def warmup_detectors():
+    """Compiles the Numba detector kernels so the first detection doesn't wait."""
+    try:
+        from . import detectors_numba
+
+        detectors_numba.warmup()
+    except Exception as e:
+        print(f"Detector warmup failed: {e}")
+
+
+def scene_cache_path(video_path, *settings):
+    # mtime and size in the key invalidate the cache when the file changes
+    st = os.stat(video_path)
+    h = new_cache_hash()
+    h.update("|".join(map(str, (video_path, st.st_mtime_ns, st.st_size) + settings)).encode())
+    file_hash = h.hexdigest()
+    return os.path.join(get_cache_dir(), f"scenedetect_{file_hash}.json")
+
+
+def detect_shots_worker(q, stop, *args):
+    """Runs find_scenes(*args), streaming cut frames into q.
+
+    Cut frames are cached as JSON, so repeat runs on an unchanged file skip
+    detection. Setting stop ends detection early without caching the
+    partial result. Puts the raised exception on failure and None once done.
+    """
+    try:
+        cache_path = scene_cache_path(*args)
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cuts = json.load(f)
+            for cut in cuts:
+                q.put(cut)
+        except (FileNotFoundError, ValueError):
+            # A missing or unreadable cache file is just a miss
+            cuts = []
+
+            def on_cut(image, frame_num):
+                # PySceneDetect 0.7 passes a FrameTimecode
+                cuts.append(int(frame_num))
+                q.put(int(frame_num))
+
+            find_scenes(*args, callback=on_cut, stop=stop)
+
+            if not stop.is_set():
+                write_json_atomic(cache_path, cuts)
+    except Exception as e:
+        q.put(e)
+    q.put(None)
+
+
+def strip_frames(sequences, *props):
+    """Reads integer frame properties of every strip with foreach_get.
+
+    Returns one int32 array per name in props, by default the final start
+    and end frames, instead of an RNA read per strip.
+    """
+    n = len(sequences)
+    arrays = []
+    for prop in props or ("frame_final_start", "frame_final_end"):
+        values = np.zeros(n, dtype=np.int32)
+        sequences.foreach_get(prop, values)
+        arrays.append(values)
+    return arrays
+
+
+def locked_strips(sequences):
+    """Returns the locked strips with their start and end frames as arrays.
+
+    Everything is read with foreach_get, so finding the locked strips under
+    a frame is a vectorized comparison instead of a scan over strips.
+    """
+    lock = np.zeros(len(sequences), dtype=bool)
+    sequences.foreach_get("lock", lock)
+    starts, ends = strip_frames(sequences)
+
+    idx = np.flatnonzero(lock)
+    return [sequences[int(i)] for i in idx], starts[idx], ends[idx]
+
+
+def split_selected_at(selection, frame, split_type, locked=None):
+    """Splits the selected, unlocked strips under frame in one operator call.
+
+    Both halves of every split stay selected, so back-to-back calls need no
+    selection churn; only the locked strips set aside for the split are
+    re-selected. locked is an optional locked_strips() result to use
+    instead of checking every selected strip.
+    """
+    if locked is None:
+        under = [
+            s
+            for s in selection
+            if s.lock and s.frame_final_start <= frame < s.frame_final_end
+        ]
+    else:
+        strips, starts, ends = locked
+        under = [strips[i] for i in np.flatnonzero((starts <= frame) & (ends > frame))]
+        under = [s for s in under if s.select]
+    for s in under:
+        s.select = False
+
+    bpy.ops.sequencer.split(frame=frame, type=split_type, side="BOTH")
+
+    for s in under:
+        s.select = True
+
+
+def selection_on_one_channel(context):
+    """Poll check: the active strip is a sound and the selection fits one channel.
+
+    poll runs on every redraw, so this uses Blender's own selected list and
+    checks the channels in a single set build.
+    """
+    scene = context.scene
+    if not (scene and scene.sequence_editor and scene.sequence_editor.active_strip):
+        return False
+
+    if scene.sequence_editor.active_strip.type != "SOUND":
+        return False
+
+    return len({strip.channel for strip in context.selected_sequences}) == 1
 
 
 class SEQUENCER_OT_split_selected(bpy.types.Operator):
@@ -82,45 +787,33 @@ class SEQUENCER_OT_split_selected(bpy.types.Operator):
     bl_label = "Split Selected"
     bl_options = {"REGISTER", "UNDO"}
 
+    split_type: EnumProperty(
+        name="Split Type",
+        description="Split type, or the add-on preference when left at default",
+        items=(
+            ("DEFAULT", "Default", "Use the split type from the add-on preferences"),
+            ("SOFT", "Soft", "Split Soft"),
+            ("HARD", "Hard", "Split Hard"),
+        ),
+        default="DEFAULT",
+    )
+
     @classmethod
     def poll(cls, context):
         return bool(context.sequences)
 
     def execute(self, context):
-        selection = context.selected_sequences
-        sequences = bpy.context.scene.sequence_editor.sequences_all
-        cf = bpy.context.scene.frame_current
-        at_cursor = []
-        cut_selected = False
-
-        # Get default split type from preferences
-        user_preferences = context.preferences
-        addon_prefs = user_preferences.addons[__name__].preferences
-        split_type = addon_prefs.split_type
-
-        # Find unlocked strips at cursor
-        for s in sequences:
-            if s.frame_final_start <= cf and s.frame_final_end > cf and not s.lock:
-                at_cursor.append(s)
-                cut_selected = cut_selected or s.select
+        cf = context.scene.frame_current
 
-        for s in at_cursor:
-            if cut_selected and s.select:
-                bpy.ops.sequencer.select_all(action="DESELECT")
-                s.select = True
-                bpy.ops.sequencer.split(
-                    frame=cf,
-                    type=split_type,
-                    side="RIGHT",
-                )
+        # Callers splitting in a loop pass split_type so preferences are
+        # only looked up once
+        split_type = self.split_type
+        if split_type == "DEFAULT":
+            user_preferences = context.preferences
+            addon_prefs = user_preferences.addons[__name__].preferences
+            split_type = addon_prefs.split_type
 
-                # Add new strip to selection
-                for i in bpy.context.scene.sequence_editor.sequences_all:
-                    if i.select:
-                        selection.append(i)
-                bpy.ops.sequencer.select_all(action="DESELECT")
-                for s in selection:
-                    s.select = True
+        split_selected_at(context.selected_sequences, cf, split_type)
 
         return {"FINISHED"}
 
@@ -140,30 +833,114 @@ class SEQUENCER_OT_detect_shots(Operator):
             and context.scene.sequence_editor.active_strip.type == "MOVIE"
         )
 
-    def execute(self, context):
-        scene = context.scene
-        sequencer = bpy.ops.sequencer
-        cf = context.scene.frame_current
+    def invoke(self, context, event):
         path = context.scene.sequence_editor.active_strip.filepath
         path = os.path.realpath(bpy.path.abspath(path))
 
+        # Every detector does its frame math in OpenCV; say so up front
+        # rather than failing in the worker thread
+        if importlib.util.find_spec("cv2") is None:
+            self.report(
+                {"ERROR"}, "Shot detection needs OpenCV (opencv-python-headless)"
+            )
+            return {"CANCELLED"}
+
+        addon_prefs = context.preferences.addons[__name__].preferences
+        detector = addon_prefs.detector
+        if detector == "HIST" and not HAS_HISTOGRAM_DETECTOR:
+            self.report({"ERROR"}, "PySceneDetect >= 0.6.4 required for HIST")
+            return {"CANCELLED"}
+
         self.report({"INFO"}, f"Please wait. Detecting shots in {path}.")
+        self._split_type = addon_prefs.split_type
+        render = context.scene.render
+        fps = round((render.fps / render.fps_base), 3)
 
         active = context.scene.sequence_editor.active_strip
         start_time = active.frame_offset_start
         end_time = active.frame_duration - active.frame_offset_end
-        scenes = find_scenes(path, 27, start_time, end_time)
-        for scene in scenes:
-            context.scene.frame_current = int(
-                scene[1].get_frames() + active.frame_start
+
+        self._cf = context.scene.frame_current
+        self._frame_start = active.frame_start
+        # Locked strips are never split, so their frames stay valid for the
+        # whole run
+        self._locked = locked_strips(context.scene.sequence_editor.sequences_all)
+
+        # Detect in a worker thread; modal() splits as cuts come in
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=detect_shots_worker,
+            args=(
+                self._queue,
+                self._stop,
+                path,
+                fps,
+                DETECTOR_THRESHOLDS[detector],
+                start_time,
+                end_time,
+                detector,
+                addon_prefs.downscale,
+                addon_prefs.backend,
+                addon_prefs.hardware_decode,
+                addon_prefs.frame_skip,
+            ),
+            daemon=True,
+        )
+        self._thread.start()
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        return self.invoke(context, None)
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            # Stops every decoder the worker runs; the partial cuts aren't cached
+            self._stop.set()
+            self.finish(context)
+            self.report({"WARNING"}, "Shot detection cancelled.")
+            return {"CANCELLED"}
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        # Drain everything detected since the last tick, then split in order
+        cuts = []
+        done = False
+        while not done:
+            try:
+                cut = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if cut is None or isinstance(cut, Exception):
+                done = True
+            else:
+                cuts.append(int(cut + self._frame_start))
+
+        for frame in sorted(set(cuts)):
+            split_selected_at(
+                context.selected_sequences, frame, self._split_type, self._locked
             )
-            sequencer.split_selected()
 
-        context.scene.frame_current = cf
+        if not done:
+            return {"PASS_THROUGH"}
+
+        self.finish(context)
+        if cut is not None:
+            self.report({"ERROR"}, f"Shot detection failed: {cut}")
+            return {"CANCELLED"}
 
         self.report({"INFO"}, "Finished: Shot detection and strip splitting.")
         return {"FINISHED"}
 
+    def finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.scene.frame_current = self._cf
+
 
 class SEQUENCER_OT_auto_editor_audio(Operator):
 
@@ -173,116 +950,292 @@ class SEQUENCER_OT_auto_editor_audio(Operator):
 
     @classmethod
     def poll(cls, context):
-        scene = context.scene
-        if not (scene and scene.sequence_editor and scene.sequence_editor.active_strip):
-            return False
-
-        if scene.sequence_editor.active_strip.type != "SOUND":
-            return False
-
-        first_channel = get_selected_strips()[0].channel
-        return all(strip.channel == first_channel for strip in get_selected_strips())
-
-    def execute(self, context):
-        cf = context.scene.frame_current
-        path = context.scene.sequence_editor.active_strip.sound.filepath
-        path = os.path.realpath(bpy.path.abspath(path))
-
-        # Hash the video file path
-        file_hash = hashlib.md5(path.encode()).hexdigest()
+        return selection_on_one_channel(context)
 
-        cached_json_path = os.path.join(AUTO_EDITOR_CACHE_DIR, f"{file_hash}.json")
+    def invoke(self, context, event):
+        # Auto-Editor is heavy to import, so only load it when it's used
+        try:
+            import auto_editor
+        except ImportError:
+            self.report({"ERROR"}, "Auto-Editor is not installed")
+            return {"CANCELLED"}
 
-        audio_start, audio_end, tmp_audiofile_path = create_temp_sound_mixdown(
-            get_selected_strips()
+        self._audio_start, self._audio_end, audiofile_path = create_temp_sound_mixdown(
+            list(context.selected_sequences)
         )
 
-        # Construct Auto-Editor command (customize as needed)
+        # Key the result on the mixdown Auto-Editor actually analyzes, not
+        # just the active strip's source file
+        file_hash = content_cache_key(audiofile_path)
+
+        # The timeline is in frames, so the frame rate is part of the key
+        fps = bpy.context.scene.render.fps
+        self._cached_json_path = os.path.join(get_cache_dir(), f"{file_hash}_{fps}.json")
+
+        # The same mixdown was analyzed before; reuse its timeline
+        layers = self.read_layers(self._cached_json_path)
+        if layers is not None:
+            self.apply_timeline(context, layers)
+            self.report({"INFO"}, "Finished: strip splitting using cached Auto-Editor.")
+            return {"FINISHED"}
+
+        # Construct Auto-Editor command (customize as needed). The JSON goes
+        # to a temp file in the cache dir and only replaces the cache entry
+        # once Auto-Editor succeeds, so a crash never leaves a partial hit.
+        fd, self._output_path = tempfile.mkstemp(dir=get_cache_dir(), suffix=".json")
+        os.close(fd)
         command = [
             "auto-editor",
-            tmp_audiofile_path,
+            audiofile_path,
             "--export_as_json",
             "--frame-rate",
-            str(bpy.context.scene.render.fps),
+            str(fps),
+            "--output",
+            self._output_path,
         ]
 
-        # Run Auto-Editor
-        completed_process = subprocess.run(command, check=True)
+        # Run Auto-Editor in the background; modal() applies the result
+        try:
+            self._proc, self._stderr = start_process(command)
+        except OSError as e:
+            self.discard_output()
+            self.report({"ERROR"}, f"Could not start Auto-Editor: {e}")
+            return {"CANCELLED"}
 
-        if completed_process.returncode != 0:
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({"INFO"}, "Running Auto-Editor, press Esc to cancel.")
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        return self.invoke(context, None)
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            self._proc.terminate()
+            self._proc.wait()
+            context.window_manager.event_timer_remove(self._timer)
+            self.discard_output()
+            self.report({"WARNING"}, "Auto-Editor cancelled.")
+            return {"CANCELLED"}
+
+        if event.type != "TIMER" or self._proc.poll() is None:
+            return {"PASS_THROUGH"}
+
+        context.window_manager.event_timer_remove(self._timer)
+
+        if self._proc.returncode != 0:
+            self.discard_output()
             self.report(
                 {"ERROR"},
-                f"Auto-Editor exited with error code {completed_process.returncode}",
+                f"Auto-Editor exited with error code {self._proc.returncode}: "
+                f"{last_error_line(self._stderr)}",
             )
             return {"CANCELLED"}
 
-        original_json_path = os.path.splitext(tmp_audiofile_path)[0] + "_ALTERED.json"
+        layers = self.read_layers(self._output_path)
+        if layers is None:
+            self.discard_output()
+            self.report({"ERROR"}, "Auto-Editor wrote a timeline that can't be read")
+            return {"CANCELLED"}
+        os.replace(self._output_path, self._cached_json_path)
+
+        self.apply_timeline(context, layers)
 
-        # Cache the JSON output
-        os.makedirs(AUTO_EDITOR_CACHE_DIR, exist_ok=True)
-        shutil.copy2(original_json_path, cached_json_path)
+        self.report({"INFO"}, "Finished: strip splitting using Auto-Editor.")
+        return {"FINISHED"}
 
-        # Load JSON from the cached location
-        timeline = ae_json.read_json(cached_json_path, auto_editor.utils.log.Log())
+    def discard_output(self):
+        try:
+            os.remove(self._output_path)
+        except FileNotFoundError:
+            pass
+
+    def read_layers(self, path):
+        """Returns the audio clips' (offset, dur) per layer of a timeline JSON.
+
+        Returns None when path is missing or can't be parsed. Only offsets
+        and durations are needed, so a v3 timeline is read as plain JSON
+        instead of being built into a Timeline, which probes the media
+        again; older formats still go through Auto-Editor's reader.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if "a" in data:
+                return [[(c["offset"], c["dur"]) for c in layer] for layer in data["a"]]
+
+            from auto_editor.formats import json as ae_json
+            from auto_editor.utils.log import Log
+
+            timeline = ae_json.read_json(path, Log())
+            return [[(c.offset, c.dur) for c in layer] for layer in timeline.a]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def apply_timeline(self, context, layers):
+        audio_start, audio_end = self._audio_start, self._audio_end
 
         content_array = []
+        cuts = set()
+
+        for audio_clips in layers:
+            for offset, dur in audio_clips:
+                clip_start = int(offset + audio_start)
+                clip_end = int(offset + dur + audio_start)
+                cuts.add(clip_start)
+                cuts.add(clip_end)
+                content_array.append([clip_start, clip_end])
+
+        # Make cuts in the sequencer; clips sharing a boundary only split
+        # once, and side="BOTH" keeps every piece selected, so one select_all
+        # covers all the cuts
+        bpy.ops.sequencer.select_all(action="SELECT")
+        for frame in sorted(cuts):
+            bpy.ops.sequencer.split(frame=frame, type="SOFT", side="BOTH")
+
+        # A strip is kept when some range starting at or before it ends at or
+        # after it: search for the last range start, then compare against the
+        # furthest end among the ranges up to there
+        content_array.sort()
+        content_starts = np.array([strc[0] for strc in content_array], dtype=np.int64)
+        content_ends = np.maximum.accumulate(
+            np.array([strc[1] for strc in content_array], dtype=np.int64)
+        )
 
-        # Make cuts in the sequencer
-        for video_clips in timeline.a:
-            for clip in video_clips:
-                context.scene.frame_current = int(clip.offset + audio_start)
-                bpy.ops.sequencer.select_all(action="SELECT")
-                bpy.ops.sequencer.split(type="SOFT")
+        # Select only the strips inside kept content. Strip frames are read
+        # with foreach_get and matched in one searchsorted, and the selection
+        # is written back in one foreach_set
+        sequences = bpy.context.scene.sequence_editor.sequences
+        strip_starts, strip_ends = strip_frames(sequences)
+
+        select = (
+            (strip_starts >= audio_start)
+            & (strip_starts <= audio_end)
+            & (strip_ends >= audio_start)
+            & (strip_ends <= audio_end)
+        )
+        if content_array:
+            idx = np.searchsorted(content_starts, strip_starts, side="right") - 1
+            select &= (idx >= 0) & (content_ends[np.maximum(idx, 0)] >= strip_ends)
+        else:
+            select[:] = False
 
-                context.scene.frame_current = int(clip.offset + clip.dur + audio_start)
-                bpy.ops.sequencer.select_all(action="SELECT")
-                bpy.ops.sequencer.split(type="SOFT")
+        sequences.foreach_set("select", select)
 
-                content_array.append(
-                    [
-                        int(clip.offset + audio_start),
-                        int(clip.offset + clip.dur + audio_start),
-                    ]
-                )
 
-        bpy.ops.sequencer.select_all(action="DESELECT")
+MMAP_HASH_THRESHOLD = 10 * 1024 * 1024
 
-        strips_in_range = [
-            strip
-            for strip in bpy.context.scene.sequence_editor.sequences
-            if audio_start <= strip.frame_final_start <= audio_end
-            and audio_start <= strip.frame_final_end <= audio_end
-        ]
 
-        for i, strip in enumerate(strips_in_range):
-            for strc in content_array:
-                if (
-                    strip.frame_final_start >= strc[0]
-                    and strip.frame_final_end <= strc[1]
-                ):
-                    strip.select = True
+def hash_file(path, bufsize=131072):
+    """Cache key from a file's full contents.
 
-        context.scene.frame_current = cf
+    Files from 10 MiB up are hashed straight from the page cache through
+    mmap; smaller ones are streamed in 128 KiB chunks.
+    """
+    h = new_cache_hash()
+    with open(path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        else:
+            buf = memoryview(bytearray(bufsize))
+            while n := f.readinto(buf):
+                h.update(buf[:n])
+    return h.hexdigest()
 
-        self.report({"INFO"}, "Finished: strip splitting using Auto-Editor.")
 
-        os.remove(tmp_audiofile_path)
-        return {"FINISHED"}
+# Content hashes by (path, size, mtime_ns), so an unchanged file is only
+# ever read once per session
+content_hashes = {}
 
 
-def send_audio_for_transcription(audio_file_path, server_url):
-    transcription_data = None
+def content_cache_key(path):
+    """hash_file(path), skipped when the file's stat is unchanged."""
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    if key not in content_hashes:
+        content_hashes[key] = hash_file(path)
+    return content_hashes[key]
 
-    with open(audio_file_path, "rb") as audio_file:
-        audio_data = audio_file.read()
-        audio_base64 = base64.b64encode(audio_data).decode("utf-8")
 
-    srt_file_path = tempfile.NamedTemporaryFile(suffix=".srt", delete=False)
+# One connection pool for the local transcription and segmentation
+# servers, so repeat runs skip the TCP handshake
+http_session = None
+
+
+def get_http_session():
+    global http_session
+    if http_session is None:
+        import requests
+
+        http_session = requests.Session()
+    return http_session
+
 
-    data = {"audio_base64": audio_base64, "srt_file_path": srt_file_path.name}
+class Base64JSONBody:
+    """The JSON transcription request, base64-encoding the audio as it's sent.
+
+    Only one chunk of encoded audio is held at a time; requests takes the
+    Content-Length from __len__ and pulls the body through read().
+    """
+
+    # A multiple of 3, so the chunks encode without padding in between
+    chunk_size = 57 * 1024
+
+    def __init__(self, audio_file, srt_file_path):
+        size = os.fstat(audio_file.fileno()).st_size
+        head = b'{"audio_base64": "'
+        self.tail = f'", "srt_file_path": {json.dumps(srt_file_path)}}}'.encode()
+        self.length = len(head) + 4 * ((size + 2) // 3) + len(self.tail)
+        self.audio_file = audio_file
+        self.buffer = bytearray(head)
+        self.done = False
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        while not self.done and (size < 0 or len(self.buffer) < size):
+            chunk = self.audio_file.read(self.chunk_size)
+            if chunk:
+                self.buffer += base64.b64encode(chunk)
+            else:
+                self.buffer += self.tail
+                self.done = True
+        if size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+def send_audio_for_transcription(audio_file_path, server_url, multipart=False):
+    import requests
+
+    transcription_data = None
+
+    srt_file_path = tempfile.NamedTemporaryFile(suffix=".srt", delete=False)
 
     try:
-        response = requests.post(server_url, json=data)
+        with open(audio_file_path, "rb") as audio_file:
+            if multipart:
+                # The raw WAV as form data, 25% smaller than base64, for
+                # servers that accept it
+                filename = os.path.basename(audio_file_path)
+                response = get_http_session().post(
+                    server_url,
+                    files={"audio": (filename, audio_file, "audio/wav")},
+                    data={"srt_file_path": srt_file_path.name},
+                )
+            else:
+                response = get_http_session().post(
+                    server_url,
+                    data=Base64JSONBody(audio_file, srt_file_path.name),
+                    headers={"Content-Type": "application/json"},
+                )
+
         response.raise_for_status()  # Raise an exception for bad status codes
 
         transcription_data = response.json()
@@ -292,12 +1245,154 @@ def send_audio_for_transcription(audio_file_path, server_url):
     return (transcription_data, srt_file_path.name)
 
 
-def get_selected_strips():
-    selected_strips = []
-    for strip in bpy.context.scene.sequence_editor.sequences:
-        if strip.select == True:
-            selected_strips.append(strip)
-    return selected_strips
+def channel_muted(scene, channel):
+    """Whether the sequencer channel is muted (Blender 3.3+ channels)."""
+    channels = getattr(scene.sequence_editor, "channels", None)
+    return bool(channels) and channels[channel].mute
+
+
+def mixdown_cache_key(selected_strips):
+    """Hashes what the mixdown of selected_strips sounds like.
+
+    Covers each strip's source file, trim, placement, volume, pan, sound
+    offset and mute state plus the scene frame rate, volume and output
+    format, so the same selection maps to the same WAV.
+    """
+    scene = bpy.context.scene
+    render = scene.render
+    h = new_cache_hash()
+    h.update(
+        f"{render.fps}/{render.fps_base}|{scene.audio_volume}|"
+        f"{render.ffmpeg.audio_channels}|{render.ffmpeg.audio_mixrate}".encode()
+    )
+    for strip in sorted(selected_strips, key=lambda s: (s.channel, s.frame_final_start)):
+        sound = getattr(strip, "sound", None)
+        source = bpy.path.abspath(sound.filepath) if sound else strip.name
+        # Edits to the source file on disk change the key too
+        if sound:
+            try:
+                st = os.stat(source)
+                source = f"{source}|{st.st_size}|{st.st_mtime_ns}"
+            except OSError:
+                pass
+        h.update(
+            f"|{source}|{strip.frame_offset_start}|{strip.frame_final_start}|"
+            f"{strip.frame_final_end}|{getattr(strip, 'volume', 1.0)}|"
+            f"{getattr(strip, 'pan', 0.0)}|{getattr(strip, 'sound_offset', 0.0)}|"
+            f"{strip.mute}|"
+            f"{channel_muted(scene, strip.channel)}".encode()
+        )
+    return h.hexdigest()
+
+
+# Channel counts for the scene's audio channel setting, which Blender's
+# mixdown writes
+AUDIO_CHANNEL_COUNTS = {
+    "MONO": 1,
+    "STEREO": 2,
+    "SURROUND4": 4,
+    "SURROUND51": 6,
+    "SURROUND71": 8,
+}
+
+
+def ffmpeg_mixdown(selected_strips, audio_start, filepath):
+    """Mixes plain sound strips into a WAV at filepath with ffmpeg.
+
+    Returns False, leaving the job to Blender's mixdown, when a strip uses
+    anything the filter graph doesn't reproduce (packed or mono sounds,
+    pan, speed changes, animation) or ffmpeg fails.
+    """
+    scene = bpy.context.scene
+    if scene.animation_data and scene.animation_data.action:
+        return False
+
+    strips = [
+        strip
+        for strip in selected_strips
+        if not strip.mute and not channel_muted(scene, strip.channel)
+    ]
+    if not strips:
+        return False
+    channels = AUDIO_CHANNEL_COUNTS.get(scene.render.ffmpeg.audio_channels)
+    if channels is None:
+        return False
+
+    fps = scene.render.fps / scene.render.fps_base
+    inputs = []
+    filters = []
+    labels = []
+    for strip in strips:
+        sound = getattr(strip, "sound", None)
+        if (
+            strip.type != "SOUND"
+            or sound is None
+            or sound.packed_file
+            or sound.use_mono
+            or strip.pan != 0
+            or getattr(strip, "speed_factor", 1.0) != 1.0
+        ):
+            return False
+        path = bpy.path.abspath(sound.filepath)
+        if not os.path.isfile(path):
+            return False
+
+        # Trim to the strip's visible part, then place it on the timeline.
+        # sound_offset shifts the sound within the strip; a negative one
+        # leaves silence at the start, like Blender does
+        offset = (strip.frame_final_start - strip.frame_start) / fps
+        offset += getattr(strip, "sound_offset", 0.0)
+        duration = strip.frame_final_duration / fps
+        delay = (strip.frame_final_start - audio_start) / fps
+        if offset < 0:
+            delay -= offset
+            duration += offset
+            offset = 0.0
+        if duration <= 0:
+            continue
+        delay = round(delay * 1000)
+        i = len(labels)
+        inputs += ["-i", path]
+        filters.append(
+            f"[{i}:a]atrim=start={offset}:duration={duration},asetpts=PTS-STARTPTS,"
+            f"volume={strip.volume},adelay={delay}:all=1[a{i}]"
+        )
+        labels.append(f"[a{i}]")
+    if not labels:
+        return False
+    filters.append(
+        f"{''.join(labels)}amix=inputs={len(labels)}:normalize=0,"
+        f"volume={scene.audio_volume}[out]"
+    )
+
+    tmp_path = filepath + ".part.wav"
+    command = [
+        "ffmpeg",
+        "-y",
+        "-loglevel",
+        "error",
+        *inputs,
+        "-filter_complex",
+        ";".join(filters),
+        "-map",
+        "[out]",
+        "-ar",
+        str(scene.render.ffmpeg.audio_mixrate),
+        "-ac",
+        str(channels),
+        "-c:a",
+        "pcm_s16le",
+        tmp_path,
+    ]
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+    os.replace(tmp_path, filepath)
+    return True
 
 
 def create_temp_sound_mixdown(selected_strips):
@@ -306,6 +1401,22 @@ def create_temp_sound_mixdown(selected_strips):
     audio_start = min(strip.frame_final_start for strip in selected_strips)
     audio_end = max(strip.frame_final_end for strip in selected_strips)
 
+    # Reuse an earlier mixdown of the same selection
+    mixdown_dir = get_mixdown_dir()
+    os.makedirs(mixdown_dir, exist_ok=True)
+    cached_path = os.path.join(
+        mixdown_dir, f"mixdown_{mixdown_cache_key(selected_strips)}.wav"
+    )
+    if os.path.exists(cached_path):
+        os.utime(cached_path)
+        return (audio_start, audio_end, cached_path)
+    prune_mixdowns()
+
+    # Plain sound strips are mixed by ffmpeg straight from their files,
+    # without going through Blender's audio engine or touching the scene
+    if ffmpeg_mixdown(selected_strips, audio_start, cached_path):
+        return (audio_start, audio_end, cached_path)
+
     # Temporarily adjust the scene's time range to focus on the selected audio
     original_frame_start, original_frame_end = (
         bpy.context.scene.frame_start,
@@ -313,14 +1424,21 @@ def create_temp_sound_mixdown(selected_strips):
     )
     bpy.context.scene.frame_start, bpy.context.scene.frame_end = audio_start, audio_end
 
-    # Mute all strips that are not selected and fall within the audio range
-    unselected_strips_in_range = [
-        strip
-        for strip in bpy.context.scene.sequence_editor.sequences
-        if audio_start <= strip.frame_final_start <= audio_end
-        and audio_start <= strip.frame_final_end <= audio_end
-        and strip not in selected_strips
-    ]
+    # Mute all strips that are not selected and fall within the audio range.
+    # Frames and selection are read with foreach_get and filtered as arrays
+    # instead of three RNA reads per strip
+    sequences = bpy.context.scene.sequence_editor.sequences
+    starts, ends = strip_frames(sequences)
+    selected = np.zeros(len(sequences), dtype=bool)
+    sequences.foreach_get("select", selected)
+    in_range = (
+        (starts >= audio_start)
+        & (starts <= audio_end)
+        & (ends >= audio_start)
+        & (ends <= audio_end)
+        & ~selected
+    )
+    unselected_strips_in_range = [sequences[int(i)] for i in np.flatnonzero(in_range)]
     for strip in unselected_strips_in_range:
         strip.mute = True
 
@@ -342,7 +1460,9 @@ def create_temp_sound_mixdown(selected_strips):
     for strip in selected_strips:
         strip.select = True
 
-    return (audio_start, audio_end, tmp_file.name)
+    shutil.move(tmp_file.name, cached_path)
+
+    return (audio_start, audio_end, cached_path)
 
 
 def add_subs(start_frame, srt_file_path):
@@ -361,15 +1481,28 @@ def add_subs(start_frame, srt_file_path):
     next_channel = max((s.channel for s in bpy.context.sequences), default=0) + 1
     text_strip = None
 
-    # Add each subtitle as a text strip
-    for sub in subs:
+    # Look these up once instead of crossing into RNA for every subtitle
+    fps = scene.render.fps
+    new_effect = sequencer.sequences.new_effect
 
-        if sub.text.strip() == "":
-            continue
+    addon_prefs = bpy.context.preferences.addons[__name__].preferences
+    use_classifier = addon_prefs.swear_classifier
+
+    # Classify every word up front so censor_text only hits the cache
+    if use_classifier:
+        classify_words(w for sub in subs for w in WORD_RE.findall(sub.text))
+
+    subs = [sub for sub in subs if sub.text.strip() != ""]
 
-        # Calculate the start and end frames based on the subtitle timings and the specified start_frame
-        start_frame_sub = start_frame + int((sub.start / 1000) * scene.render.fps)
-        end_frame_sub = start_frame + int((sub.end / 1000) * scene.render.fps)
+    # Calculate the start and end frames based on the subtitle timings and
+    # the specified start_frame, for all subtitles at once
+    starts = np.fromiter((sub.start for sub in subs), dtype=np.int64, count=len(subs))
+    ends = np.fromiter((sub.end for sub in subs), dtype=np.int64, count=len(subs))
+    start_frames = (start_frame + (starts / 1000 * fps).astype(np.int64)).tolist()
+    end_frames = (start_frame + (ends / 1000 * fps).astype(np.int64)).tolist()
+
+    # Add each subtitle as a text strip
+    for sub, start_frame_sub, end_frame_sub in zip(subs, start_frames, end_frames):
 
         print(start_frame_sub, end_frame_sub, sub.text)
 
@@ -377,7 +1510,7 @@ def add_subs(start_frame, srt_file_path):
             continue
 
         # Create a text strip
-        text_strip = sequencer.sequences.new_effect(
+        text_strip = new_effect(
             name=sub.text,
             type="TEXT",
             channel=next_channel,
@@ -386,14 +1519,7 @@ def add_subs(start_frame, srt_file_path):
         )
 
         # Set the subtitle text
-        tmp_list = []
-        for word in sub.text.split():
-            if sch.predict(word)[0]:
-                tmp_list.append("###")
-            else:
-                tmp_list.append(word)
-        censured_text = " ".join(tmp_list)
-        text_strip.text = censured_text
+        text_strip.text = censor_text(sub.text, use_classifier)
         #
 
         text_strip.font_size = 70
@@ -401,8 +1527,7 @@ def add_subs(start_frame, srt_file_path):
         text_strip.use_italic = True
         text_strip.use_shadow = True
         text_strip.use_outline = True
-        text_strip.location[0] = 0.5
-        text_strip.location[1] = 0.2
+        text_strip.location = (0.5, 0.2)
 
     print("Subtitles added successfully!")
 
@@ -415,17 +1540,7 @@ class SEQUENCER_OT_mute_audio_profanity(Operator):
 
     @classmethod
     def poll(cls, context):
-        scene = context.scene
-        if not (scene and scene.sequence_editor and scene.sequence_editor.active_strip):
-            return False
-
-        if scene.sequence_editor.active_strip.type != "SOUND":
-            return False
-
-        selected_strips = get_selected_strips()
-
-        first_channel = selected_strips[0].channel
-        return all(strip.channel == first_channel for strip in selected_strips)
+        return selection_on_one_channel(context)
 
     def execute(self, context):
         scene = context.scene
@@ -435,15 +1550,32 @@ class SEQUENCER_OT_mute_audio_profanity(Operator):
         addon_prefs = user_preferences.addons[__name__].preferences
         split_type = addon_prefs.split_type
 
-        fps = bpy.context.scene.render.fps
+        # Both are only imported when used; report a missing one up front
+        try:
+            import requests  # noqa: F401
+        except ImportError:
+            self.report({"ERROR"}, "requests is not installed")
+            return {"CANCELLED"}
+        if addon_prefs.swear_classifier:
+            try:
+                import check_swear  # noqa: F401
+            except ImportError:
+                self.report(
+                    {"ERROR"},
+                    "check_swear is not installed; install it or turn off "
+                    "Profanity Classifier in the add-on preferences",
+                )
+                return {"CANCELLED"}
+
+        fps = scene.render.fps
 
-        audio_start, audio_end, tmp_audiofile_path = create_temp_sound_mixdown(
-            get_selected_strips()
+        audio_start, audio_end, audiofile_path = create_temp_sound_mixdown(
+            list(context.selected_sequences)
         )
 
         server_url = "http://localhost:5302/transcribe"
         transcription_data, srt_file_path = send_audio_for_transcription(
-            tmp_audiofile_path, server_url
+            audiofile_path, server_url, addon_prefs.multipart_upload
         )
 
         next_channel = max((s.channel for s in bpy.context.sequences), default=0) + 1
@@ -452,65 +1584,95 @@ class SEQUENCER_OT_mute_audio_profanity(Operator):
 
             # print(transcription_data["segments"])
 
+            # Collect the ranges first and mute them in frame order: each
+            # split leaves the strips right of it selected, so the selection
+            # walks forward with the ranges
+            use_classifier = addon_prefs.swear_classifier
+            if use_classifier:
+                classify_words(
+                    word["text"]
+                    for seg in transcription_data["segments"]
+                    for word in seg["words"]
+                )
+
+            ranges = {}
             for seg in transcription_data["segments"]:
                 for word in seg["words"]:
-                    if sch.predict(word["text"].lower().strip())[0]:
+                    if is_swear(word["text"], use_classifier):
                         tmp_start = int(word["start"] * fps)
                         tmp_end = int(word["end"] * fps)
-                        # start
-                        context.scene.frame_current = audio_start + tmp_start
-
-                        # sequencer.select_all(action="SELECT")
-                        sequencer.split(
-                            frame=context.scene.frame_current,
-                            type=split_type,
-                            side="RIGHT",
-                        )
-
-                        sequencer.mute(unselected=False)
-                        marker = scene.timeline_markers.new(
-                            word["text"] + str(context.scene.frame_current)
-                        )
-                        marker.frame = context.scene.frame_current
-                        # end
-
-                        context.scene.frame_current = audio_start + tmp_end
-                        # sequencer.select_all(action="SELECT")
-                        sequencer.split(
-                            frame=context.scene.frame_current,
-                            type=split_type,
-                            side="RIGHT",
-                        )
-
-                        sequencer.unmute(unselected=False)
-                        marker = scene.timeline_markers.new(
-                            word["text"] + str(context.scene.frame_current)
-                        )
-                        marker.frame = context.scene.frame_current
-
-                        #
-
-                        tmp_bass_file = os.path.dirname(__file__) + "/bass.wav"
-
-                        newStrip = context.scene.sequence_editor.sequences.new_sound(
-                            name=os.path.basename(tmp_bass_file),
-                            filepath=tmp_bass_file,
-                            channel=next_channel,
-                            frame_start=audio_start + tmp_start,
-                        )
-                        newStrip.show_waveform = True
-                        newStrip.sound.use_mono = True
-                        newStrip.volume = 0.05
-                        newStrip.animation_offset_start = 5
-                        newStrip.frame_final_duration = tmp_end - tmp_start - 1
-
-                        #
+                        ranges.setdefault((tmp_start, tmp_end), word["text"])
+
+            # Swears that overlap or sit within 0.15 s of each other are muted
+            # as one range, saving a split pair each and leaving no slivers
+            # of unmuted audio between them
+            gap = int(0.15 * fps)
+            merged = []
+            for (tmp_start, tmp_end), text in sorted(ranges.items()):
+                if merged and tmp_start <= merged[-1][1] + gap:
+                    prev_start, prev_end, prev_text = merged[-1]
+                    merged[-1] = (
+                        prev_start,
+                        max(prev_end, tmp_end),
+                        f"{prev_text} {text}",
+                    )
+                else:
+                    merged.append((tmp_start, tmp_end, text))
+
+            tmp_bass_file = os.path.dirname(__file__) + "/bass.wav"
+
+            # Every bass strip shares one sound datablock
+            bass_sound = bpy.data.sounds.load(tmp_bass_file, check_existing=True)
+            bass_sound.use_mono = True
+
+            # Markers are added after all the splits, in one pass
+            marker_spec = []
+            new_sound = scene.sequence_editor.sequences.new_sound
+
+            for tmp_start, tmp_end, text in merged:
+                # start
+                frame = audio_start + tmp_start
+                sequencer.split(frame=frame, type=split_type, side="RIGHT")
+                for strip in context.selected_sequences:
+                    strip.mute = True
+                marker_spec.append((frame, text + str(frame)))
+
+                # end
+                frame = audio_start + tmp_end
+                sequencer.split(frame=frame, type=split_type, side="RIGHT")
+                for strip in context.selected_sequences:
+                    strip.mute = False
+                marker_spec.append((frame, text + str(frame)))
+
+                #
+
+                newStrip = new_sound(
+                    name=os.path.basename(tmp_bass_file),
+                    filepath=bass_sound.filepath,
+                    channel=next_channel,
+                    frame_start=audio_start + tmp_start,
+                )
+                # new_sound may load its own copy of the file; point the
+                # strip back at the shared datablock and drop the copy
+                if newStrip.sound != bass_sound:
+                    loaded = newStrip.sound
+                    newStrip.sound = bass_sound
+                    if not loaded.users:
+                        bpy.data.sounds.remove(loaded)
+                newStrip.show_waveform = True
+                newStrip.volume = 0.05
+                newStrip.animation_offset_start = 5
+                newStrip.frame_final_duration = tmp_end - tmp_start - 1
+
+            markers = scene.timeline_markers
+            for frame, name in marker_spec:
+                markers.new(name, frame=frame)
+
+            save_swear_cache()
 
         else:
             print("Transcription failed or returned no data")
 
-        os.remove(tmp_audiofile_path)
-
         # add_subs(audio_start, srt_file_path)
 
         return {"FINISHED"}
@@ -533,17 +1695,58 @@ class SEQUENCER_OT_speechnorm(Operator):
 
         return True
 
-    def execute(self, context):
+    def invoke(self, context, event):
+        active = context.scene.sequence_editor.active_strip
 
-        # Use context manager for tempfile to ensure proper cleanup
-        with tempfile.NamedTemporaryFile(
-            dir="./audio", suffix=".wav", delete=False
-        ) as tmp_file:
-            input_filename = os.path.abspath(
-                bpy.path.abspath(
-                    context.scene.sequence_editor.active_strip.sound.filepath
+        # Every selected sound strip is filtered, or just the active one
+        strips = [s for s in context.selected_sequences if s.type == "SOUND"]
+        if not strips:
+            strips = [active]
+
+        # Pieces split from one source share a single ffmpeg run; each piece
+        # keeps its unadjusted start and trim to line the result up again
+        pieces_by_source = {}
+        for strip in strips:
+            input_filename = os.path.abspath(bpy.path.abspath(strip.sound.filepath))
+            pieces_by_source.setdefault(input_filename, []).append(
+                # frame_start is a float since Blender 3.3, new_sound wants an int
+                (
+                    int(round(strip.frame_start)),
+                    strip.frame_offset_start,
+                    strip.frame_offset_end,
                 )
             )
+        self._pending = collections.deque(pieces_by_source.items())
+
+        # Run up to one ffmpeg per core in the background; modal() starts
+        # the rest as slots free up and adds the results
+        self._running = []
+        self._done = []
+        self._failed = 0
+        self._last_error = ""
+        self._max_jobs = os.cpu_count() or 1
+        try:
+            self.start_jobs()
+        except OSError as e:
+            self.discard_outputs(self._running)
+            self.report({"ERROR"}, f"Could not start ffmpeg: {e}")
+            return {"CANCELLED"}
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        return self.invoke(context, None)
+
+    def start_jobs(self):
+        while self._pending and len(self._running) < self._max_jobs:
+            input_filename, pieces = self._pending.popleft()
+            with tempfile.NamedTemporaryFile(
+                dir="./audio", suffix=".wav", delete=False
+            ) as tmp_file:
+                output_path = tmp_file.name
 
             command = [
                 "ffmpeg",
@@ -552,26 +1755,93 @@ class SEQUENCER_OT_speechnorm(Operator):
                 input_filename,
                 "-filter:a",
                 "speechnorm",
-                tmp_file.name,
+                "-c:a",
+                "pcm_s16le",
+                output_path,
             ]
-
             try:
-                subprocess.run(command, check=True)
-            except subprocess.CalledProcessError as e:
-                self.report({"ERROR"}, f"ffmpeg exited with error: {e}")
-                return {"CANCELLED"}
+                proc, stderr_tail = start_process(command)
+            except OSError:
+                os.remove(output_path)
+                raise
+            self._running.append((proc, stderr_tail, output_path, pieces))
+
+    def discard_outputs(self, jobs):
+        # Partial, failed or unused files would pile up in ./audio
+        for job in jobs:
+            try:
+                os.remove(job[-2])
+            except OSError:
+                pass
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            for proc, *_ in self._running:
+                proc.terminate()
+            for proc, *_ in self._running:
+                proc.wait()
+            self.discard_outputs(self._running)
+            self.discard_outputs(self._done)
+            context.window_manager.event_timer_remove(self._timer)
+            self.report({"WARNING"}, "Speechnorm cancelled.")
+            return {"CANCELLED"}
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        still_running = []
+        for job in self._running:
+            proc = job[0]
+            if proc.poll() is None:
+                still_running.append(job)
+            elif proc.returncode != 0:
+                self._failed += 1
+                self._last_error = last_error_line(job[1])
+                self.discard_outputs([job])
+            else:
+                self._done.append(job[2:])
+        self._running = still_running
 
-            # Determine the next available channel
-            next_channel = max((s.channel for s in context.sequences), default=0) + 1
+        try:
+            self.start_jobs()
+        except OSError as e:
+            self.report({"ERROR"}, f"Could not start ffmpeg: {e}")
+            self._pending.clear()
+
+        if self._running:
+            return {"PASS_THROUGH"}
+
+        context.window_manager.event_timer_remove(self._timer)
+
+        # Blender data is only touched here, on the main thread. Each
+        # source gets one new channel holding all of its filtered pieces
+        sequences = context.scene.sequence_editor.sequences
+        next_channel = max((s.channel for s in context.sequences), default=0) + 1
+        scratch_channel = next_channel + len(self._done)
+        for output_path, pieces in self._done:
+            for frame_start, offset_start, offset_end in pieces:
+                # The filtered file covers the whole source, so it's added
+                # on an empty channel and trimmed to the piece it replaces
+                # before moving next to its siblings
+                new_strip = sequences.new_sound(
+                    name=os.path.basename(output_path),
+                    filepath=output_path,
+                    channel=scratch_channel,
+                    frame_start=frame_start,
+                )
+                new_strip.frame_offset_start = offset_start
+                new_strip.frame_offset_end = offset_end
+                new_strip.channel = next_channel
+                new_strip.show_waveform = True
+            next_channel += 1
 
-            # Add new sound strip
-            new_strip = context.scene.sequence_editor.sequences.new_sound(
-                name=os.path.basename(tmp_file.name),
-                filepath=tmp_file.name,
-                channel=next_channel,
-                frame_start=bpy.context.scene.sequence_editor.active_strip.final_start_frame,
+        if self._failed:
+            self.report(
+                {"ERROR"},
+                f"ffmpeg failed on {self._failed} file(s): {self._last_error}",
             )
-            new_strip.show_waveform = True
+            if not self._done:
+                return {"CANCELLED"}
 
         return {"FINISHED"}
 
@@ -580,7 +1850,8 @@ class SEQUENCER_OT_speechnorm(Operator):
 def menu_detect_shots(self, context):
     self.layout.separator()
     self.layout.operator("sequencer.detect_shots")
-    self.layout.operator("sequencer.auto_editor_audio")
+    if HAS_AUTO_EDITOR:
+        self.layout.operator("sequencer.auto_editor_audio")
     self.layout.operator("sequencer.mute_audio_profanity")
     self.layout.operator("sequencer.speechnorm")
 
@@ -598,20 +1869,13 @@ def find_segments(arr):
       and contains the start and end indices (inclusive) of the segment.
     """
 
-    segments = []
-    start = None
-    for i, val in enumerate(arr):
-        if val == 1:
-            if start is None:
-                start = i
-        elif start is not None:  # val == 0
-            segments.append((start, i - 1))
-            start = None
+    # Pad with 0s so every run has a rising and a falling edge in the diff
+    ones = (np.asarray(arr) == 1).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], ones, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
 
-    if start is not None:
-        segments.append((start, len(arr) - 1))
-
-    return segments
+    return list(zip(starts.tolist(), ends.tolist()))
 
 
 def process_segmentation_data(data):
@@ -683,6 +1947,12 @@ class SpeechSegmentationOperator(bpy.types.Operator):
         strip = context.scene.sequence_editor.active_strip
         props = context.scene.speech_segmentation_props
 
+        try:
+            import requests
+        except ImportError:
+            self.report({"ERROR"}, "requests is not installed")
+            return {"CANCELLED"}
+
         server_url = "http://localhost:5303/api/segment"
         sample_audio_path = props.sample_audio_path
 
@@ -695,7 +1965,7 @@ class SpeechSegmentationOperator(bpy.types.Operator):
         )
 
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 server_url,
                 data={"main_path": main_audio_path, "sample_path": sample_audio_path},
             )
@@ -708,7 +1978,6 @@ class SpeechSegmentationOperator(bpy.types.Operator):
         print(response.json())
 
         data1 = response.json()
-        sd_path = Path(data1["segmentation_data"])
 
         data2 = None
         with open(data1["segmentation_data"], "r", encoding="utf-8") as f:
@@ -748,25 +2017,27 @@ class SpeechSegmentationOperator(bpy.types.Operator):
                     side="RIGHT",
                 )
 
-        color_strips = []
-        sequences = bpy.context.scene.sequence_editor.sequences_all
-        for seq in sequences:
-            if seq.channel == 1:
-                color_strips.append(seq)
+        # Snapshot the strips once and bucket them by channel instead of
+        # rescanning sequences_all for every long color strip
+        by_channel = collections.defaultdict(list)
+        for seq in bpy.context.scene.sequence_editor.sequences_all:
+            by_channel[seq.channel].append(seq)
+
+        color_strips = by_channel[1]
+        others = [
+            (seq, seq.frame_final_start, seq.frame_final_end)
+            for channel, seqs in by_channel.items()
+            if channel != 1
+            for seq in seqs
+        ]
 
         bpy.ops.sequencer.select_all(action="DESELECT")
         for col in color_strips:
-            if int((col.frame_final_end - col.frame_final_start) / fps) > 18:
-                sequences = bpy.context.scene.sequence_editor.sequences_all
-
-                for seq in sequences:
-                    if (
-                        seq.frame_final_start >= col.frame_final_start
-                        and seq.frame_final_end <= col.frame_final_end
-                        and seq.channel != 1
-                    ):
+            col_start, col_end = col.frame_final_start, col.frame_final_end
+            if int((col_end - col_start) / fps) > 18:
+                for seq, seq_start, seq_end in others:
+                    if seq_start >= col_start and seq_end <= col_end:
                         seq.select = True
-                        # color_strips.append(seq)
 
         self.report({"INFO"}, "Speech segmentation complete!")
         return {"FINISHED"}
@@ -794,27 +2065,46 @@ class SpeechSegmentationPanel(bpy.types.Panel):
 classes = (
     SEQUENCER_OT_detect_shots,
     SEQUENCER_OT_split_selected,
-    SEQUENCER_OT_auto_editor_audio,
     SEQUENCER_OT_mute_audio_profanity,
     SEQUENCER_OT_speechnorm,
     SpeechSegmentationOperator, 
     SpeechSegmentationProps, 
-    SpeechSegmentationPanel
+    SpeechSegmentationPanel,
     MyAddonPreferences,
 )
+if HAS_AUTO_EDITOR:
+    classes += (SEQUENCER_OT_auto_editor_audio,)
 
 
 def register():
+    os.makedirs(get_cache_dir(), exist_ok=True)
+    load_swear_cache()
+
     for cls in classes:
         bpy.utils.register_class(cls)
+
+    # Warm up only what the current settings will use, off the main thread:
+    # the classifier may hit the network, and Numba compilation takes
+    # seconds on a cold cache. Otherwise both load on first use.
+    addon = bpy.context.preferences.addons.get(__name__)
+    if addon is not None:
+        if addon.preferences.swear_classifier:
+            threading.Thread(target=warmup_swear_check, daemon=True).start()
+        if addon.preferences.detector in ("HIST_L1", "PIXEL"):
+            threading.Thread(target=warmup_detectors, daemon=True).start()
     bpy.types.SEQUENCER_MT_context_menu.append(menu_detect_shots)
     bpy.types.SEQUENCER_MT_strip.append(menu_detect_shots)
-        bpy.types.Scene.speech_segmentation_props = bpy.props.PointerProperty(
+    bpy.types.Scene.speech_segmentation_props = bpy.props.PointerProperty(
         type=SpeechSegmentationProps
     )
 
 
 def unregister():
+    global http_session
+    save_swear_cache()
+    if http_session is not None:
+        http_session.close()
+        http_session = None
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     bpy.types.SEQUENCER_MT_context_menu.remove(menu_detect_shots)
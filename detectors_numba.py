@@ -0,0 +1,48 @@
+"""Frame-difference kernels for the PyAV shot detectors.
+
+Compiled with Numba when it is installed, plain NumPy otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def hist_l1(prev, cur):
+        """L1 distance between two normalized histograms (0 to 2)."""
+        s = 0.0
+        for i in prange(prev.size):
+            s += abs(prev[i] - cur[i])
+        return s
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def pairwise_diff_frac(prev, cur, t):
+        """Fraction of pixels whose value changed by more than t."""
+        n = 0
+        for i in prange(prev.size):
+            if abs(np.int16(prev[i]) - np.int16(cur[i])) > t:
+                n += 1
+        return n / prev.size
+
+else:
+
+    def hist_l1(prev, cur):
+        """L1 distance between two normalized histograms (0 to 2)."""
+        return float(np.abs(prev - cur).sum())
+
+    def pairwise_diff_frac(prev, cur, t):
+        """Fraction of pixels whose value changed by more than t."""
+        diff = np.abs(prev.astype(np.int16) - cur.astype(np.int16))
+        return np.count_nonzero(diff > t) / prev.size
+
+
+def warmup():
+    """Compiles the kernels, or loads them from Numba's cache, ahead of use."""
+    hist_l1(np.zeros(64, dtype=np.float64), np.zeros(64, dtype=np.float64))
+    pairwise_diff_frac(np.zeros(64, dtype=np.uint8), np.zeros(64, dtype=np.uint8), 30)